@@ -1,21 +1,100 @@
-from typing import Any, Awaitable, Callable, Coroutine, Generator, Never, TypeGuard
-
-from ._error_guard import error_guard
-
-__all__ = ["AsyncCombinator", "error_guard"]
-
-
+import asyncio
+from inspect import iscoroutine
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Generator,
+    Never,
+    cast,
+    final,
+)
+
+from ._error_guard import ErrorGuard, _fast_guard, error_guard
+from ._pipeline import (
+    MAP,
+    MAP_ERR,
+    OR_ELSE,
+    THEN,
+    TYPED,
+    UNWRAP_OR_ELSE,
+    Guard,
+    compile_runner,
+)
+
+__all__ = ["AsyncCombinator", "error_guard", "identity"]
+
+
+def identity[T](value: T) -> T:
+    """
+    Return value unchanged.
+
+    AsyncCombinator.map recognises this function and returns the combinator itself
+    instead of chaining a no-op, which makes conditional steps such as
+    .map(f if cond else identity) free when the condition is false.
+    """
+    return value
+
+
+async def _gather[T](awaitables: list[Awaitable[T]]) -> list[T]:
+    # Deferred so that nothing is scheduled until the combinator is awaited
+    return await asyncio.gather(*awaitables)
+
+
+# Chaining always builds a plain AsyncCombinator, so subclasses would not survive a
+# chained call; @final tells type checkers so and has no runtime effect
+@final
 class AsyncCombinator[T]:
+    __slots__ = ("_awaitable", "_kinds", "_fns", "_guards", "_claims")
+
     def __init__(self, awaitable: Awaitable[T]):
         self._awaitable = awaitable
+        # Chained ops, stored as parallel tuples so the kinds tuple can key the
+        # compiled runner cache directly
+        self._kinds: tuple[int, ...] = ()
+        self._fns: tuple[Callable[..., Any], ...] = ()
+        self._guards: tuple[Guard | None, ...] = ()
+        # One cell per chained op, set once the chain through it has been awaited
+        self._claims: tuple[list[bool], ...] = ()
 
     def __await__(self) -> Generator[Any, Any, T]:
-        return self._awaitable.__await__()
+        if not self._kinds:
+            return self._awaitable.__await__()
+        # Each chained op runs once, like the coroutine it used to be wrapped in.
+        # Awaiting claims every op in the chain, so no other combinator sharing one of
+        # those ops, such as a parent or a sibling chained from it, can run it again
+        claims = self._claims
+        for claim in claims:
+            if claim[0]:
+                raise RuntimeError("cannot reuse already awaited coroutine")
+        for claim in claims:
+            claim[0] = True
+        run = compile_runner(self._kinds)
+        return run(self._awaitable, self._kinds, self._fns, self._guards)
+
+    def _chain(
+        self, kind: int, f: Callable[..., Any], guard: Guard | None = None
+    ) -> "AsyncCombinator[Any]":
+        if isinstance(guard, tuple):
+            kind |= TYPED
+        # Skip __init__: every slot is assigned here, so its defaults would be
+        # thrown away immediately
+        combinator = object.__new__(AsyncCombinator)
+        combinator._awaitable = self._awaitable
+        combinator._kinds = self._kinds + (kind,)
+        combinator._fns = self._fns + (f,)
+        combinator._guards = self._guards + (guard,)
+        combinator._claims = self._claims + ([False],)
+        return combinator
 
     async def _coro(self) -> T:
         return await self
 
     def __call__(self) -> Coroutine[Any, Any, T]:
+        if not self._kinds and iscoroutine(self._awaitable):
+            # Nothing to run after the coroutine, so hand it out without a wrapper
+            return self._awaitable
         return self._coro()
 
     def map[U](self, f: Callable[[T], U]) -> "AsyncCombinator[U]":
@@ -29,12 +108,13 @@ class AsyncCombinator[T]:
 
         This is useful to chain along a computation once an awaitable has been resolved
         successfully.
-        """
 
-        async def map_coro():
-            return f(await self)
+        Mapping with identity returns this combinator unchanged.
+        """
 
-        return AsyncCombinator(map_coro())
+        if f is identity:
+            return cast("AsyncCombinator[U]", self)
+        return self._chain(MAP, f)
 
     def then[U](self, f: Callable[[T], Awaitable[U]]) -> "AsyncCombinator[U]":
         """
@@ -50,22 +130,20 @@ class AsyncCombinator[T]:
         propagated.
         """
 
-        async def then_coro():
-            return await f(await self)
-
-        return AsyncCombinator(then_coro())
+        return self._chain(THEN, f)
 
     def or_else[SelfErr: BaseException](
         self,
         f: Callable[[SelfErr], Awaitable[T]],
-        error_guard: Callable[[BaseException], TypeGuard[SelfErr]],
+        error_guard: ErrorGuard[SelfErr],
     ) -> "AsyncCombinator[T]":
         """
         Executes another awaitable if this one raises a specific exception type.
 
         The error value is passed to the function f to create a recovery awaitable.
-        The error_guard function is used to determine if the raised exception matches
-        the expected type SelfErr.
+        The error_guard is used to determine if the raised exception matches the
+        expected type SelfErr. It is either a guard function or, like the second
+        argument of isinstance, an exception class or tuple of classes.
 
         The provided function f will only be called if this awaitable raises an
         exception that passes the error_guard check. If this awaitable completes
@@ -76,27 +154,21 @@ class AsyncCombinator[T]:
         of this awaitable.
         """
 
-        async def or_else_coro():
-            try:
-                return await self
-            except BaseException as e:
-                if error_guard(e):
-                    return await f(e)
-                raise
-
-        return AsyncCombinator(or_else_coro())
+        return self._chain(OR_ELSE, f, _fast_guard(error_guard))
 
     def map_err[U, SelfErr: BaseException](
         self,
         f: Callable[[SelfErr], Never],
-        error_guard: Callable[[BaseException], TypeGuard[SelfErr]],
+        error_guard: ErrorGuard[SelfErr],
     ) -> "AsyncCombinator[T]":
         """
         Transforms a specific exception type into a different exception.
 
         This method can be used to change the exception type raised by this awaitable
-        into a different exception type. The error_guard function is used to determine
-        if the raised exception matches the expected type SelfErr.
+        into a different exception type. The error_guard is used to determine if the
+        raised exception matches the expected type SelfErr. It is either a guard
+        function or, like the second argument of isinstance, an exception class or
+        tuple of classes.
 
         The provided function f will only be called if this awaitable raises an
         exception that passes the error_guard check. The function f should raise a
@@ -108,25 +180,13 @@ class AsyncCombinator[T]:
         exception hierarchies.
         """
 
-        async def map_err_coro():
-            try:
-                return await self
-            except BaseException as e:
-                if error_guard(e):
-                    # f should raise
-                    try:
-                        f(e)
-                    except BaseException as f_e:
-                        raise f_e from None
-                raise
-
-        return AsyncCombinator(map_err_coro())
+        return self._chain(MAP_ERR, f, _fast_guard(error_guard))
 
     def map_ok_or_else[U, SelfErr: BaseException](
         self,
         f: Callable[[T], U],
         e: Callable[[SelfErr], Never],
-        error_guard: Callable[[BaseException], TypeGuard[SelfErr]],
+        error_guard: ErrorGuard[SelfErr],
     ) -> "AsyncCombinator[U]":
         """
         Transforms both successful results and specific exceptions into a common type.
@@ -145,26 +205,13 @@ class AsyncCombinator[T]:
         unified way, or when you need to transform exceptions into a different form.
         """
 
-        async def map_ok_or_else_coro():
-            try:
-                result = await self
-
-            except BaseException as _e:
-                if error_guard(_e):
-                    # e should raise
-                    try:
-                        e(_e)
-                    except BaseException as e_e:
-                        raise e_e from None
-                raise
-            return f(result)
-
-        return AsyncCombinator(map_ok_or_else_coro())
+        # f runs outside the guarded region, exactly like map_err followed by map
+        return self._chain(MAP_ERR, e, _fast_guard(error_guard))._chain(MAP, f)
 
     def unwrap_or_else[SelfErr: BaseException](
         self,
         f: Callable[[SelfErr], T],
-        error_guard: Callable[[BaseException], TypeGuard[SelfErr]],
+        error_guard: ErrorGuard[SelfErr],
     ) -> "AsyncCombinator[T]":
         """
         Returns the successful value, or computes a default value synchronously
@@ -195,12 +242,28 @@ class AsyncCombinator[T]:
             )
         """
 
-        async def unwrap_or_else_coro():
-            try:
-                return await self
-            except BaseException as e:
-                if error_guard(e):
-                    return f(e)
-                raise
+        return self._chain(UNWRAP_OR_ELSE, f, _fast_guard(error_guard))
+
+    @staticmethod
+    def gather[U](*combinators: "AsyncCombinator[U]") -> "AsyncCombinator[list[U]]":
+        """
+        Run several combinators concurrently, returning a new awaitable of the list of
+        their results in the order they were given.
+
+        The combinators are scheduled together with asyncio.gather, so awaiting the
+        result takes as long as the slowest of them rather than the sum of all of
+        them. Each combinator still runs its own chain of operations. If any of them
+        raises, the first exception is propagated.
+
+        Example:
+            names = await AsyncCombinator.gather(
+                AsyncCombinator(fetch_user(1)).map(lambda u: u["name"]),
+                AsyncCombinator(fetch_user(2)).map(lambda u: u["name"]),
+            )
+        """
 
-        return AsyncCombinator(unwrap_or_else_coro())
+        # Combinators without chained ops are passed through as-is, so Tasks and
+        # Futures are gathered directly rather than wrapped in a coroutine
+        return AsyncCombinator(
+            _gather([c() if c._kinds else c._awaitable for c in combinators])
+        )
@@ -1,10 +1,79 @@
-from typing import Callable, TypeGuard
+from functools import partial
+from typing import Any, Callable, TypeGuard, cast
+
+
+# What combinators accept as an error guard: a TypeGuard function, or an exception
+# class or tuple of classes as accepted by isinstance.
+type ErrorGuard[E: BaseException] = (
+    Callable[[BaseException], TypeGuard[E]] | type[E] | tuple[type[E], ...]
+)
+
+
+class _ErrorGuard(partial[bool]):
+    # The exception classes this guard matches, so combinators can check them
+    # with an inline isinstance instead of calling the guard.
+    classes: tuple[type, ...]
+
+
+def _isinstance_of(classes: tuple[type, ...], e: BaseException) -> bool:
+    return isinstance(e, classes)
 
 
 def error_guard[T](
     *classes: type[T],
 ) -> Callable[[BaseException], TypeGuard[T]]:
-    def guard(e: BaseException) -> TypeGuard[T]:
-        return isinstance(e, classes)
+    if len(classes) == 1:
+        # Bind the metaclass __instancecheck__ to the class so that calling the guard
+        # is a single C-level call instead of a Python frame wrapping isinstance.
+        (cls,) = classes
+        instancecheck: Any = type(cls).__instancecheck__
+        guard = _ErrorGuard(instancecheck, cls)
+    else:
+        guard = _ErrorGuard(_isinstance_of, classes)
+    guard.classes = classes
+    return cast(Callable[[BaseException], TypeGuard[T]], guard)
+
+
+def _exception_classes(classes: tuple[Any, ...]) -> bool:
+    return all(
+        isinstance(cls, type) and issubclass(cls, BaseException) for cls in classes
+    )
+
+
+def _catchable(classes: tuple[type, ...]) -> bool:
+    # An except clause only follows the real class hierarchy, so it agrees with
+    # isinstance only for classes whose metaclass keeps the default __instancecheck__
+    # (ABCs with registered subclasses, for one, do not)
+    return all(type(cls).__instancecheck__ is type.__instancecheck__ for cls in classes)
+
+
+def _fast_guard(
+    guard: ErrorGuard[BaseException],
+) -> Callable[[BaseException], bool] | tuple[type, ...]:
+    """
+    Return the guard as a tuple of exception classes when it is one, is a single
+    class, or was built by error_guard, or the guard itself for any other callable.
 
-    return guard
+    Classes are only returned as a tuple when an except clause matches them exactly
+    like isinstance does; otherwise an isinstance predicate over them is returned.
+    Raises TypeError for a class or tuple entry that is not an exception class.
+    """
+    # Checked before the callable case, since classes are callable too
+    if isinstance(guard, type):
+        classes: tuple[type, ...] = (guard,)
+    elif isinstance(guard, tuple):
+        classes = guard
+    elif isinstance(guard, _ErrorGuard):
+        classes = guard.classes
+    else:
+        return guard
+    if not _exception_classes(classes):
+        # Fail at chaining time rather than with an except clause's TypeError that
+        # would replace the exception being handled
+        raise TypeError(
+            "error_guard must be a guard function, an exception class or a tuple of "
+            f"exception classes, not {guard!r}"
+        )
+    if _catchable(classes):
+        return classes
+    return partial(_isinstance_of, classes)
@@ -0,0 +1,155 @@
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Generator
+
+# Op kinds. Kinds at or above OR_ELSE only run when an exception is pending.
+MAP = 0
+THEN = 1
+OR_ELSE = 2
+UNWRAP_OR_ELSE = 3
+MAP_ERR = 4
+
+# Flag set on an error-handling kind whose guard is a tuple of exception classes.
+# Compiled runners catch those classes in the except clause itself, so exceptions
+# they don't match pass the handler by without being caught and re-raised.
+TYPED = 8
+
+# A guard is either a guard callable or, for guards built by error_guard, the tuple
+# of exception classes to check with isinstance directly.
+type Guard = Callable[[BaseException], bool] | tuple[type, ...]
+type Runner = Callable[
+    [Awaitable[Any], tuple[int, ...], tuple[Callable[..., Any], ...], tuple[Any, ...]],
+    Generator[Any, Any, Any],
+]
+
+
+def drive(
+    awaitable: Awaitable[Any],
+    kinds: tuple[int, ...],
+    fns: tuple[Callable[..., Any], ...],
+    guards: tuple[Guard | None, ...],
+) -> Generator[Any, Any, Any]:
+    """
+    Await the underlying awaitable once, then run every chained op in order inside
+    this single generator frame.
+
+    A pending exception is carried in error rather than raised between ops, so each
+    error-handling op sees exactly what the nested wrapper coroutines would have
+    caught: anything raised upstream, including by earlier ops. This is the fallback
+    for pipeline shapes that compile_runner cannot turn into straight-line code.
+    """
+    error: BaseException | None = None
+    value: Any = None
+    try:
+        value = yield from awaitable.__await__()
+    except BaseException as e:
+        error = e
+
+    for kind, f, guard in zip(kinds, fns, guards):
+        kind &= ~TYPED
+        try:
+            if error is None:
+                if kind == MAP:
+                    value = f(value)
+                elif kind == THEN:
+                    value = yield from f(value).__await__()
+            elif (
+                kind >= OR_ELSE
+                and guard is not None
+                and (
+                    isinstance(error, guard)
+                    if isinstance(guard, tuple)
+                    else guard(error)
+                )
+            ):
+                if kind == OR_ELSE:
+                    value = yield from f(error).__await__()
+                    error = None
+                elif kind == UNWRAP_OR_ELSE:
+                    value = f(error)
+                    error = None
+                else:
+                    # f should raise; if it returns, the original error stands
+                    f(error)
+        except BaseException as e:
+            if error is not None and e is not error:
+                # Mirror raising from inside the handler of the pending error
+                e.__context__ = error
+                if kind == MAP_ERR:
+                    e.__cause__ = None
+                    e.__suppress_context__ = True
+            error = e
+
+    if error is not None:
+        raise error
+    return value
+
+
+_HANDLERS = {
+    OR_ELSE: ["value = yield from fns[{i}](e).__await__()"],
+    UNWRAP_OR_ELSE: ["value = fns[{i}](e)"],
+    # Equivalent to "raise f_e from None", but re-raises f's exception in place
+    # instead of raising it a second time. If f returns, the original error stands.
+    MAP_ERR: [
+        "try:",
+        "    fns[{i}](e)",
+        "except BaseException as f_e:",
+        "    f_e.__cause__ = None",
+        "    f_e.__suppress_context__ = True",
+        "    raise",
+        "raise",
+    ],
+}
+
+
+# Every error-handling op adds a level of try/except nesting to the generated code.
+# CPython caps statically nested blocks at 20, and some releases crash in the
+# compiler well before raising SyntaxError, so stay comfortably below that.
+_MAX_NESTED_HANDLERS = 10
+
+
+def _indent(lines: list[str]) -> list[str]:
+    return ["    " + line for line in lines]
+
+
+@lru_cache(maxsize=256)
+def compile_runner(kinds: tuple[int, ...]) -> Runner:
+    """
+    Build a generator function that runs one specific sequence of op kinds as
+    straight-line code, with each error-handling op wrapping everything before it
+    in its own try/except, exactly like the nested wrapper coroutines would.
+
+    Runners are cached by shape, so pipelines built by the same code path pay for
+    codegen once. Shapes that nest too deeply for the compiler fall back to drive.
+    """
+    if sum(kind >= OR_ELSE for kind in kinds) > _MAX_NESTED_HANDLERS:
+        return drive
+
+    body = ["value = yield from awaitable.__await__()"]
+    for i, kind in enumerate(kinds):
+        if kind == MAP:
+            body.append(f"value = fns[{i}](value)")
+        elif kind == THEN:
+            body.append(f"value = yield from fns[{i}](value).__await__()")
+        elif kind & TYPED:
+            body = [
+                "try:",
+                *_indent(body),
+                f"except guards[{i}] as e:",
+                *_indent([line.format(i=i) for line in _HANDLERS[kind & ~TYPED]]),
+            ]
+        else:
+            body = [
+                "try:",
+                *_indent(body),
+                "except BaseException as e:",
+                f"    if not guards[{i}](e):",
+                "        raise",
+                *_indent([line.format(i=i) for line in _HANDLERS[kind]]),
+            ]
+    body.append("return value")
+
+    source = "\n".join(["def run(awaitable, kinds, fns, guards):", *_indent(body)])
+    code = compile(source, f"<async_combinator {kinds}>", "exec")
+    namespace: dict[str, Any] = {}
+    exec(code, namespace)
+    return namespace["run"]
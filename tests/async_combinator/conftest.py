@@ -0,0 +1,42 @@
+import asyncio
+import sys
+from typing import TypeGuard
+
+import pytest
+
+# Event loop policies are deprecated from Python 3.14 and pytest-asyncio offers no
+# other hook to swap the loop, so there the tests keep its default asyncio loop
+if sys.version_info < (3, 14):
+    try:
+        import uvloop
+    except ImportError:  # not installed, or on Windows where uvloop doesn't build
+        pass
+    else:
+
+        @pytest.fixture(scope="session")
+        def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+            """Run the tests on uvloop instead of the default asyncio loop."""
+            return uvloop.EventLoopPolicy()
+
+
+def ready[T](value: T) -> asyncio.Future[T]:
+    """Build an already-resolved future, cheaper to await than a constant coroutine."""
+    future: asyncio.Future[T] = asyncio.get_running_loop().create_future()
+    future.set_result(value)
+    return future
+
+
+def is_value_error(e: BaseException) -> TypeGuard[ValueError]:
+    return isinstance(e, ValueError)
+
+
+def is_key_error(e: BaseException) -> TypeGuard[KeyError]:
+    return isinstance(e, KeyError)
+
+
+class CustomError(Exception):
+    pass
+
+
+def is_custom_error(e: BaseException) -> TypeGuard[CustomError]:
+    return isinstance(e, CustomError)
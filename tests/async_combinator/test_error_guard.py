@@ -0,0 +1,128 @@
+import pytest
+from abc import ABCMeta
+from async_combinator import AsyncCombinator, error_guard
+
+
+class ValueErrorSubclass(ValueError):
+    pass
+
+
+class RegisteredError(Exception, metaclass=ABCMeta):
+    pass
+
+
+# ValueError is a virtual subclass: isinstance matches it, an except clause doesn't
+RegisteredError.register(ValueError)
+
+
+class TestErrorGuard:
+    """Test cases for the error_guard helper."""
+
+    def test_error_guard_single_class(self):
+        """Test error_guard with a single exception class."""
+        guard = error_guard(ValueError)
+
+        assert guard(ValueError("error")) is True
+        assert guard(KeyError("error")) is False
+
+    def test_error_guard_matches_subclasses(self):
+        """Test that error_guard matches subclasses of the given classes."""
+
+        assert error_guard(ValueError)(ValueErrorSubclass("error")) is True
+        assert error_guard(ValueError, KeyError)(ValueErrorSubclass("error")) is True
+
+    def test_error_guard_multiple_classes(self):
+        """Test error_guard with several exception classes."""
+        guard = error_guard(ValueError, KeyError)
+
+        assert guard(ValueError("error")) is True
+        assert guard(KeyError("error")) is True
+        assert guard(RuntimeError("error")) is False
+
+    @pytest.mark.asyncio
+    async def test_error_guard_with_combinator(self):
+        """Test error_guard used as the guard of a combinator."""
+
+        async def err_coro() -> str:
+            raise KeyError("missing")
+
+        result = await AsyncCombinator(err_coro()).unwrap_or_else(
+            lambda e: f"recovered: {e.args[0]}", error_guard(ValueError, KeyError)
+        )
+
+        assert result == "recovered: missing"
+
+    @pytest.mark.asyncio
+    async def test_error_guard_non_matching_with_combinator(self):
+        """Test that exceptions not matched by error_guard propagate unchanged."""
+
+        async def err_coro() -> str:
+            raise RuntimeError("unexpected")
+
+        def never_called_func(error: ValueError) -> str:
+            raise AssertionError("This function should never be called")
+
+        combinator = AsyncCombinator(err_coro())
+
+        with pytest.raises(RuntimeError, match="unexpected"):
+            await combinator.unwrap_or_else(never_called_func, error_guard(ValueError))
+
+    @pytest.mark.asyncio
+    async def test_error_guard_chained_handlers(self):
+        """Test an exception passing non-matching handlers to reach a matching one."""
+
+        async def err_coro() -> str:
+            raise KeyError("missing")
+
+        def never_called_func(error: BaseException) -> str:
+            raise AssertionError("This function should never be called")
+
+        result = await (
+            AsyncCombinator(err_coro())
+            .unwrap_or_else(never_called_func, error_guard(ValueError))
+            .unwrap_or_else(never_called_func, error_guard(TypeError, RuntimeError))
+            .unwrap_or_else(lambda e: f"recovered: {e.args[0]}", error_guard(KeyError))
+            .unwrap_or_else(never_called_func, error_guard(KeyError))
+        )
+
+        assert result == "recovered: missing"
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "guard",
+        [error_guard(RegisteredError), RegisteredError, (RegisteredError,)],
+        ids=["error_guard", "class", "tuple"],
+    )
+    # More than 10 handlers in one chain are run without compiling the chain
+    @pytest.mark.parametrize("handlers", [1, 11], ids=["compiled", "interpreted"])
+    async def test_error_guard_matches_virtual_subclasses(self, guard, handlers):
+        """Test that class guards match registered ABC subclasses like isinstance."""
+
+        async def err_coro() -> str:
+            raise ValueError("error")
+
+        def never_called_func(error: BaseException) -> str:
+            raise AssertionError("This function should never be called")
+
+        combinator = AsyncCombinator(err_coro())
+        for _ in range(handlers - 1):
+            combinator = combinator.unwrap_or_else(never_called_func, KeyError)
+        result = await combinator.unwrap_or_else(lambda e: "caught", guard)
+
+        assert result == "caught"
+
+    @pytest.mark.parametrize(
+        "guard",
+        [int, (ValueError, int), error_guard(ValueError, int)],
+        ids=["class", "tuple", "error_guard"],
+    )
+    def test_non_exception_class_guard_rejected(self, guard):
+        """Test that class guards must only contain exception classes."""
+
+        async def ok_coro() -> str:
+            return "ok"
+
+        coro = ok_coro()
+        with pytest.raises(TypeError, match="exception classes"):
+            AsyncCombinator(coro).unwrap_or_else(lambda e: "recovered", guard)
+        coro.close()
@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+from async_combinator import AsyncCombinator
+from .conftest import ready
+
+
+class TestAsyncCombinatorGather:
+    """Test cases for AsyncCombinator.gather method."""
+
+    @pytest.mark.asyncio
+    async def test_gather_basic_functionality(self):
+        """Test basic gather functionality, preserving argument order."""
+
+        async def value_coro(value: int) -> int:
+            return value
+
+        result = await AsyncCombinator.gather(
+            AsyncCombinator(value_coro(1)),
+            AsyncCombinator(value_coro(2)),
+            AsyncCombinator(value_coro(3)),
+        )
+
+        assert result == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_gather_runs_chained_operations(self):
+        """Test that each gathered combinator runs its own chain of operations."""
+
+        async def value_coro(value: int) -> int:
+            return value
+
+        async def double_coro(value: int) -> int:
+            return value * 2
+
+        result = await AsyncCombinator.gather(
+            AsyncCombinator(value_coro(1)).map(lambda x: x + 1),
+            AsyncCombinator(value_coro(2)).then(double_coro),
+        )
+
+        assert result == [2, 4]
+
+    @pytest.mark.asyncio
+    async def test_gather_runs_concurrently(self):
+        """Test that gathered combinators wait on each other concurrently."""
+        first_started = asyncio.Event()
+
+        async def first_coro() -> str:
+            first_started.set()
+            await asyncio.sleep(0)
+            return "first"
+
+        async def second_coro() -> str:
+            # Only completes if first_coro was started without waiting for us
+            await first_started.wait()
+            return "second"
+
+        result = await AsyncCombinator.gather(
+            AsyncCombinator(second_coro()),
+            AsyncCombinator(first_coro()),
+        )
+
+        assert result == ["second", "first"]
+
+    @pytest.mark.asyncio
+    async def test_gather_with_task_and_future(self):
+        """Test gather with asyncio Task and Future objects."""
+
+        async def task_coro() -> str:
+            return "task_result"
+
+        future = asyncio.Future()
+        future.set_result("future_result")
+
+        result = await AsyncCombinator.gather(
+            AsyncCombinator(asyncio.create_task(task_coro())),
+            AsyncCombinator(future).map(str.upper),
+        )
+
+        assert result == ["task_result", "FUTURE_RESULT"]
+
+    @pytest.mark.asyncio
+    async def test_gather_exception_propagation(self):
+        """Test that an exception from any gathered combinator is propagated."""
+
+        async def err_coro() -> int:
+            raise ValueError("gather failure")
+
+        with pytest.raises(ValueError, match="gather failure"):
+            await AsyncCombinator.gather(
+                AsyncCombinator(ready(1)), AsyncCombinator(err_coro())
+            )
+
+    @pytest.mark.asyncio
+    async def test_gather_can_be_chained(self):
+        """Test chaining further combinators on the result of gather."""
+
+        async def value_coro(value: int) -> int:
+            return value
+
+        result = await AsyncCombinator.gather(
+            AsyncCombinator(value_coro(1)), AsyncCombinator(value_coro(2))
+        ).map(sum)
+
+        assert result == 3
+
+    @pytest.mark.asyncio
+    async def test_gather_with_no_combinators(self):
+        """Test gather with no combinators returns an empty list."""
+        result = await AsyncCombinator.gather()
+
+        assert result == []
+
+    @pytest.mark.asyncio
+    async def test_gather_is_lazy(self):
+        """Test that gather schedules nothing until the result is awaited."""
+        started = []
+
+        async def value_coro(value: int) -> int:
+            started.append(value)
+            return value
+
+        combinator = AsyncCombinator.gather(
+            AsyncCombinator(value_coro(1)).map(lambda x: x + 1),
+            AsyncCombinator(value_coro(2)),
+        )
+        # Give the loop a chance to run anything that was scheduled
+        await asyncio.sleep(0)
+        assert started == []
+
+        assert await combinator == [2, 2]
+        assert started == [1, 2]
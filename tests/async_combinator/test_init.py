@@ -160,3 +160,100 @@ class TestAsyncCombinatorBasic:
         # Verify it works correctly
         result = await combinator
         assert result == "test"
+
+    @pytest.mark.asyncio
+    async def test_call_returns_coroutine(self):
+        """Test that calling the combinator returns a coroutine usable as a task."""
+
+        async def test_coro():
+            return "test"
+
+        coro = AsyncCombinator(test_coro())()
+        assert asyncio.iscoroutine(coro)
+        assert await asyncio.create_task(coro) == "test"
+
+    @pytest.mark.asyncio
+    async def test_call_with_chained_combinators_and_future(self):
+        """Test calling a chained combinator wrapping a Future."""
+        future = asyncio.Future()
+        future.set_result(20)
+
+        coro = AsyncCombinator(future).map(lambda x: x + 1)()
+        assert asyncio.iscoroutine(coro)
+        assert await asyncio.create_task(coro) == 21
+
+    @pytest.mark.asyncio
+    async def test_combinator_has_no_instance_dict(self):
+        """Test that AsyncCombinator instances use slots instead of a __dict__."""
+
+        async def test_coro():
+            return "test"
+
+        combinator = AsyncCombinator(test_coro()).map(str.upper)
+
+        assert not hasattr(combinator, "__dict__")
+        assert await combinator == "TEST"
+
+    @pytest.mark.asyncio
+    async def test_done_future_resolves_without_suspending(self):
+        """Test that a chain over an already-done Future never yields to the loop."""
+        future = asyncio.Future()
+        future.set_result(20)
+
+        combinator = AsyncCombinator(future).map(lambda x: x + 1).map(str)
+        generator = combinator.__await__()
+
+        with pytest.raises(StopIteration) as exc_info:
+            generator.send(None)
+
+        assert exc_info.value.value == "21"
+
+    @pytest.mark.asyncio
+    async def test_chained_combinator_awaited_twice(self):
+        """Test that a chained combinator runs its ops once, even over a Future."""
+        calls = []
+        future = asyncio.Future()
+        future.set_result(20)
+
+        combinator = AsyncCombinator(future).map(calls.append)
+
+        await combinator
+        with pytest.raises(RuntimeError, match="already awaited"):
+            await combinator
+
+        assert calls == [20]
+        # The Future itself can still be awaited again, as can a new chain over it
+        assert await AsyncCombinator(future) == 20
+        assert await AsyncCombinator(future).map(lambda x: x + 1) == 21
+
+    @pytest.mark.asyncio
+    async def test_shared_chain_prefix_runs_once(self):
+        """Test that ops shared by several chains run once, even over a Future."""
+        calls = []
+        future = asyncio.Future()
+        future.set_result(20)
+
+        base = AsyncCombinator(future).map(lambda x: calls.append(x) or x)
+
+        assert await base.map(lambda x: x + 1) == 21
+        with pytest.raises(RuntimeError, match="already awaited"):
+            await base.map(lambda x: x + 2)
+        with pytest.raises(RuntimeError, match="already awaited"):
+            await base
+
+        assert calls == [20]
+
+    @pytest.mark.asyncio
+    async def test_child_of_awaited_chain_is_rejected(self):
+        """Test that a chain extending an already-awaited combinator cannot run."""
+        calls = []
+        future = asyncio.Future()
+        future.set_result(20)
+
+        base = AsyncCombinator(future).map(lambda x: calls.append(x) or x)
+
+        assert await base == 20
+        with pytest.raises(RuntimeError, match="already awaited"):
+            await base.map(lambda x: x + 1)
+
+        assert calls == [20]
@@ -1,5 +1,6 @@
 import pytest
-from async_combinator import AsyncCombinator
+from async_combinator import AsyncCombinator, identity
+from .conftest import ready
 
 
 class TestAsyncCombinatorMap:
@@ -9,13 +10,10 @@ class TestAsyncCombinatorMap:
     async def test_map_basic_functionality(self):
         """Test basic map method functionality."""
 
-        async def initial_coro():
-            return 5
-
         def double_func(value: int) -> int:
             return value * 2
 
-        combinator = AsyncCombinator(initial_coro())
+        combinator = AsyncCombinator(ready(5))
         result = await combinator.map(double_func)
 
         assert result == 10
@@ -24,16 +22,13 @@ class TestAsyncCombinatorMap:
     async def test_map_with_different_types(self):
         """Test map method with different input and output types."""
 
-        async def string_coro():
-            return "hello"
-
         def length_func(s: str) -> int:
             return len(s)
 
         def is_even_func(n: int) -> bool:
             return n % 2 == 0
 
-        combinator = AsyncCombinator(string_coro())
+        combinator = AsyncCombinator(ready("hello"))
         result = await combinator.map(length_func).map(is_even_func)
 
         assert result is False  # len("hello") = 5, which is odd
@@ -42,9 +37,6 @@ class TestAsyncCombinatorMap:
     async def test_map_chaining(self):
         """Test chaining multiple map calls."""
 
-        async def start_coro():
-            return 1
-
         def add_one_func(n: int) -> int:
             return n + 1
 
@@ -55,7 +47,7 @@ class TestAsyncCombinatorMap:
             return n**2
 
         result = await (
-            AsyncCombinator(start_coro())
+            AsyncCombinator(ready(1))
             .map(add_one_func)
             .map(multiply_by_two_func)
             .map(square_func)
@@ -68,9 +60,6 @@ class TestAsyncCombinatorMap:
     async def test_map_with_complex_objects(self):
         """Test map method with complex objects."""
 
-        async def user_coro():
-            return {"id": 1, "name": "Alice", "age": 30}
-
         def extract_name_func(user: dict) -> str:
             return user["name"]
 
@@ -78,7 +67,9 @@ class TestAsyncCombinatorMap:
             return f"Hello, {name}!"
 
         result = (
-            await AsyncCombinator(user_coro()).map(extract_name_func).map(greet_func)
+            await AsyncCombinator(ready({"id": 1, "name": "Alice", "age": 30}))
+            .map(extract_name_func)
+            .map(greet_func)
         )
 
         assert result == "Hello, Alice!"
@@ -87,13 +78,10 @@ class TestAsyncCombinatorMap:
     async def test_map_exception_propagation(self):
         """Test that exceptions in map functions are properly propagated."""
 
-        async def initial_coro():
-            return 10
-
         def failing_func(value: int) -> int:
             raise ValueError(f"Failed with value {value}")
 
-        combinator = AsyncCombinator(initial_coro())
+        combinator = AsyncCombinator(ready(10))
 
         with pytest.raises(ValueError, match="Failed with value 10"):
             await combinator.map(failing_func)
@@ -102,13 +90,10 @@ class TestAsyncCombinatorMap:
     async def test_map_with_none_values(self):
         """Test map method with None values."""
 
-        async def none_coro():
-            return None
-
         def check_none_func(value) -> bool:
             return value is None
 
-        result = await AsyncCombinator(none_coro()).map(check_none_func)
+        result = await AsyncCombinator(ready(None)).map(check_none_func)
 
         assert result is True
 
@@ -116,9 +101,6 @@ class TestAsyncCombinatorMap:
     async def test_map_with_boolean_logic(self):
         """Test map method with boolean operations."""
 
-        async def number_coro():
-            return 7
-
         def is_prime_func(n: int) -> bool:
             if n < 2:
                 return False
@@ -130,9 +112,7 @@ class TestAsyncCombinatorMap:
         def negate_func(is_prime: bool) -> bool:
             return not is_prime
 
-        result = await (
-            AsyncCombinator(number_coro()).map(is_prime_func).map(negate_func)
-        )
+        result = await AsyncCombinator(ready(7)).map(is_prime_func).map(negate_func)
 
         assert result is False  # 7 is prime, so not prime = False
 
@@ -140,16 +120,13 @@ class TestAsyncCombinatorMap:
     async def test_map_return_type_annotation(self):
         """Test that map method properly handles type annotations."""
 
-        async def int_coro() -> int:
-            return 42
-
         def str_func(n: int) -> str:
             return str(n)
 
         def list_func(s: str) -> list:
             return list(s)
 
-        result = await AsyncCombinator(int_coro()).map(str_func).map(list_func)
+        result = await AsyncCombinator(ready(42)).map(str_func).map(list_func)
 
         assert result == ["4", "2"]
 
@@ -167,3 +144,28 @@ class TestAsyncCombinatorMap:
 
         with pytest.raises(RuntimeError, match="Initial failure"):
             await combinator.map(never_called_func)
+
+    @pytest.mark.asyncio
+    async def test_map_with_identity_returns_same_combinator(self):
+        """Test that mapping with identity does not chain a new operation."""
+
+        combinator = AsyncCombinator(ready(5))
+        mapped = combinator.map(identity)
+
+        assert mapped is combinator
+        assert await mapped == 5
+
+    @pytest.mark.asyncio
+    async def test_map_with_conditional_identity(self):
+        """Test map with identity used as the no-op branch of a conditional step."""
+
+        def double_func(value: int) -> int:
+            return value * 2
+
+        result = await (
+            AsyncCombinator(ready(5))
+            .map(double_func if False else identity)
+            .map(double_func if True else identity)
+        )
+
+        assert result == 10
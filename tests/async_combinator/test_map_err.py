@@ -1,7 +1,12 @@
 # AI GENERATED CONTENT
 import pytest
-from typing import TypeGuard, Never
+from typing import Never
 from async_combinator import AsyncCombinator
+from .conftest import CustomError, is_custom_error, is_key_error, is_value_error, ready
+
+
+class TransformedError(Exception):
+    pass
 
 
 class TestAsyncCombinatorMapErr:
@@ -17,9 +22,6 @@ class TestAsyncCombinatorMapErr:
         def transform_func(error: ValueError) -> Never:
             raise KeyError(f"transformed: {error}")
 
-        def is_value_error(e: BaseException) -> TypeGuard[ValueError]:
-            return isinstance(e, ValueError)
-
         combinator = AsyncCombinator(err_coro())
 
         with pytest.raises(KeyError, match="transformed: error"):
@@ -29,16 +31,10 @@ class TestAsyncCombinatorMapErr:
     async def test_map_err_with_successful_completion(self):
         """Test map_err with successful completion - should not call the function."""
 
-        async def ok_coro():
-            return 42
-
         def never_called_func(error: ValueError) -> Never:
             raise AssertionError("This function should never be called")
 
-        def is_value_error(e: BaseException) -> TypeGuard[ValueError]:
-            return isinstance(e, ValueError)
-
-        combinator = AsyncCombinator(ok_coro())
+        combinator = AsyncCombinator(ready(42))
         result = await combinator.map_err(never_called_func, is_value_error)
 
         assert result == 42
@@ -56,12 +52,6 @@ class TestAsyncCombinatorMapErr:
         def second_transform_func(error: KeyError) -> Never:
             raise RuntimeError(f"second: {error.args[0]}")
 
-        def is_value_error(e: BaseException) -> TypeGuard[ValueError]:
-            return isinstance(e, ValueError)
-
-        def is_key_error(e: BaseException) -> TypeGuard[KeyError]:
-            return isinstance(e, KeyError)
-
         with pytest.raises(RuntimeError, match="second: first: first error"):
             await (
                 AsyncCombinator(start_coro())
@@ -79,9 +69,6 @@ class TestAsyncCombinatorMapErr:
         def to_key_error_func(error: ValueError) -> Never:
             raise KeyError(len(error.args[0]))
 
-        def is_value_error(e: BaseException) -> TypeGuard[ValueError]:
-            return isinstance(e, ValueError)
-
         combinator = AsyncCombinator(err_coro())
 
         with pytest.raises(KeyError) as exc_info:
@@ -100,70 +87,87 @@ class TestAsyncCombinatorMapErr:
         def exception_func(error: ValueError) -> Never:
             raise RuntimeError(f"exception with error: {error}")
 
-        def is_value_error(e: BaseException) -> TypeGuard[ValueError]:
-            return isinstance(e, ValueError)
-
         combinator = AsyncCombinator(err_coro())
 
         with pytest.raises(RuntimeError, match="exception with error: error"):
             await combinator.map_err(exception_func, is_value_error)
 
     @pytest.mark.asyncio
-    async def test_map_err_with_non_matching_exception(self):
-        """Test map_err when the exception doesn't match the guard."""
+    @pytest.mark.parametrize(
+        "error, guard",
+        [
+            pytest.param(
+                KeyError("wrong error type"),
+                is_value_error,
+                id="non_matching_exception",
+            ),
+            pytest.param(
+                ValueError("original error"),
+                is_key_error,
+                id="preserves_original_exception_when_guard_fails",
+            ),
+        ],
+    )
+    async def test_map_err_with_non_matching_exception(self, error, guard):
+        """Test map_err re-raises the original exception when the guard fails."""
 
         async def err_coro():
-            raise KeyError("wrong error type")
+            raise error
 
-        def never_called_func(error: ValueError) -> Never:
+        def never_called_func(error: BaseException) -> Never:
             raise AssertionError("This function should never be called")
 
-        def is_value_error(e: BaseException) -> TypeGuard[ValueError]:
-            return isinstance(e, ValueError)
-
         combinator = AsyncCombinator(err_coro())
 
-        with pytest.raises(KeyError, match="wrong error type"):
-            await combinator.map_err(never_called_func, is_value_error)
+        with pytest.raises(type(error)) as exc_info:
+            await combinator.map_err(never_called_func, guard)
+
+        assert exc_info.value is error
 
     @pytest.mark.asyncio
     async def test_map_err_with_custom_exception(self):
         """Test map_err with a custom exception type."""
 
-        class CustomError(Exception):
-            pass
-
-        class TransformedError(Exception):
-            pass
-
         async def err_coro():
             raise CustomError("custom error")
 
         def transform_func(error: CustomError) -> Never:
             raise TransformedError(f"transformed: {error}")
 
-        def is_custom_error(e: BaseException) -> TypeGuard[CustomError]:
-            return isinstance(e, CustomError)
-
         combinator = AsyncCombinator(err_coro())
 
         with pytest.raises(TransformedError, match="transformed: custom error"):
             await combinator.map_err(transform_func, is_custom_error)
 
     @pytest.mark.asyncio
-    async def test_map_err_preserves_original_exception_when_guard_fails(self):
-        """Test that map_err preserves the original exception when guard fails."""
+    async def test_map_err_suppresses_original_exception_context(self):
+        """Test that map_err raises the new exception as if raised from None."""
 
         async def err_coro():
             raise ValueError("original error")
 
-        def never_called_func(error: KeyError) -> Never:
-            raise AssertionError("This function should never be called")
+        def transform_func(error: ValueError) -> Never:
+            raise KeyError("transformed")
+
+        combinator = AsyncCombinator(err_coro())
+
+        with pytest.raises(KeyError) as exc_info:
+            await combinator.map_err(transform_func, is_value_error)
 
-        def is_key_error(e: BaseException) -> TypeGuard[KeyError]:
-            return isinstance(e, KeyError)
+        assert exc_info.value.__cause__ is None
+        assert exc_info.value.__suppress_context__ is True
+
+    @pytest.mark.asyncio
+    async def test_map_err_with_exception_class_guard(self):
+        """Test map_err with an exception class passed directly as the guard."""
+
+        async def err_coro():
+            raise ValueError("error")
+
+        def transform_func(error: ValueError) -> Never:
+            raise KeyError(f"transformed: {error}")
 
         combinator = AsyncCombinator(err_coro())
 
-        with pytest.raises(ValueError, match="original error"):
-            await combinator.map_err(never_called_func, is_key_error)
+        with pytest.raises(KeyError, match="transformed: error"):
+            await combinator.map_err(transform_func, ValueError)
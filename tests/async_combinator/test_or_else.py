@@ -1,27 +1,33 @@
 # AI GENERATED CONTENT
+import asyncio
 import pytest
-from typing import TypeGuard
-from async_combinator import AsyncCombinator
+from async_combinator import AsyncCombinator, error_guard
+from .conftest import CustomError, is_custom_error, is_key_error, is_value_error, ready
 
 
 class TestAsyncCombinatorOrElse:
     """Test cases for AsyncCombinator.or_else method."""
 
     @pytest.mark.asyncio
-    async def test_or_else_with_matching_exception(self):
-        """Test or_else with a matching exception type."""
+    @pytest.mark.parametrize(
+        "error, guard",
+        [
+            pytest.param(ValueError("error"), is_value_error, id="matching_exception"),
+            pytest.param(CustomError("error"), is_custom_error, id="custom_exception"),
+            pytest.param(ValueError("error"), ValueError, id="exception_class_guard"),
+        ],
+    )
+    async def test_or_else_with_matching_exception(self, error, guard):
+        """Test or_else with an exception that passes the guard."""
 
         async def err_coro() -> int:
-            raise ValueError("error")
+            raise error
 
-        async def recover_coro(error: ValueError) -> int:
-            return len(str(error))
-
-        def is_value_error(e: BaseException) -> TypeGuard[ValueError]:
-            return isinstance(e, ValueError)
+        async def recover_coro(error: Exception) -> int:
+            return len(error.args[0])
 
         combinator = AsyncCombinator(err_coro())
-        result = await combinator.or_else(recover_coro, is_value_error)
+        result = await combinator.or_else(recover_coro, guard)
 
         assert result == 5  # len("error") = 5
 
@@ -29,16 +35,10 @@ class TestAsyncCombinatorOrElse:
     async def test_or_else_with_successful_completion(self):
         """Test or_else with successful completion - should not call the function."""
 
-        async def ok_coro():
-            return 42
-
         async def never_called_coro(error: ValueError):
             raise AssertionError("This coroutine should never be called")
 
-        def is_value_error(e: BaseException) -> TypeGuard[ValueError]:
-            return isinstance(e, ValueError)
-
-        combinator = AsyncCombinator(ok_coro())
+        combinator = AsyncCombinator(ready(42))
         result = await combinator.or_else(never_called_coro, is_value_error)
 
         assert result == 42
@@ -56,12 +56,6 @@ class TestAsyncCombinatorOrElse:
         async def second_recovery_coro(error: KeyError) -> int:
             return len(error.args[0])
 
-        def is_value_error(e: BaseException) -> TypeGuard[ValueError]:
-            return isinstance(e, ValueError)
-
-        def is_key_error(e: BaseException) -> TypeGuard[KeyError]:
-            return isinstance(e, KeyError)
-
         result = await (
             AsyncCombinator(start_coro())
             .or_else(first_recovery_coro, is_value_error)
@@ -80,16 +74,18 @@ class TestAsyncCombinatorOrElse:
         async def error_coro(error: ValueError):
             raise RuntimeError(f"recovery failed: {error}")
 
-        def is_value_error(e: BaseException) -> TypeGuard[ValueError]:
-            return isinstance(e, ValueError)
-
         combinator = AsyncCombinator(err_coro())
 
         with pytest.raises(RuntimeError, match="recovery failed: original error"):
             await combinator.or_else(error_coro, is_value_error)
 
     @pytest.mark.asyncio
-    async def test_or_else_with_non_matching_exception(self):
+    @pytest.mark.parametrize(
+        "guard",
+        [is_value_error, ValueError, (ValueError, TypeError)],
+        ids=["type_guard", "exception_class_guard", "exception_tuple_guard"],
+    )
+    async def test_or_else_with_non_matching_exception(self, guard):
         """Test or_else when the exception doesn't match the guard."""
 
         async def err_coro():
@@ -98,51 +94,82 @@ class TestAsyncCombinatorOrElse:
         async def never_called_coro(error: ValueError):
             raise AssertionError("This coroutine should never be called")
 
-        def is_value_error(e: BaseException) -> TypeGuard[ValueError]:
-            return isinstance(e, ValueError)
-
         combinator = AsyncCombinator(err_coro())
 
         with pytest.raises(KeyError, match="wrong error type"):
-            await combinator.or_else(never_called_coro, is_value_error)
+            await combinator.or_else(never_called_coro, guard)
 
     @pytest.mark.asyncio
-    async def test_or_else_with_custom_exception(self):
-        """Test or_else with a custom exception type."""
+    async def test_or_else_recovers_from_error_in_earlier_map(self):
+        """Test or_else catches exceptions raised by earlier combinators in the chain."""
 
-        class CustomError(Exception):
-            pass
+        def failing_func(value: int) -> int:
+            raise ValueError(f"map failed with {value}")
 
-        async def err_coro() -> str:
-            raise CustomError("custom error")
+        async def recover_coro(error: ValueError) -> int:
+            return len(error.args[0])
 
-        async def recover_coro(error: CustomError) -> str:
-            return f"recovered: {error.args[0]}"
+        result = await (
+            AsyncCombinator(ready(5))
+            .map(failing_func)
+            .or_else(recover_coro, is_value_error)
+        )
 
-        def is_custom_error(e: BaseException) -> TypeGuard[CustomError]:
-            return isinstance(e, CustomError)
+        assert result == 17  # len("map failed with 5") = 17
+
+    @pytest.mark.asyncio
+    async def test_or_else_long_chain(self):
+        """Test a long chain of or_else calls, each recovering from the previous."""
+
+        async def err_coro() -> int:
+            raise ValueError("0")
+
+        async def bump_coro(error: ValueError) -> int:
+            raise ValueError(str(int(error.args[0]) + 1))
 
         combinator = AsyncCombinator(err_coro())
-        result = await combinator.or_else(recover_coro, is_custom_error)
+        for _ in range(30):
+            combinator = combinator.or_else(bump_coro, is_value_error)
 
-        assert result == "recovered: custom error"
+        with pytest.raises(ValueError, match="^30$"):
+            await combinator
 
     @pytest.mark.asyncio
-    async def test_or_else_with_type_guard(self):
-        """Test or_else with a proper TypeGuard."""
+    async def test_or_else_propagates_cancellation(self):
+        """Test that cancellation passes through or_else guards that don't match it."""
+        started = asyncio.Event()
 
-        from typing import TypeGuard
+        async def slow_coro() -> str:
+            started.set()
+            await asyncio.sleep(10)
+            return "never"
 
-        async def err_coro():
-            raise ValueError("test error")
+        async def never_called_coro(error: ValueError) -> str:
+            raise AssertionError("This coroutine should never be called")
 
-        async def recover_coro(error: ValueError):
-            return error.args[0].upper()
+        task = asyncio.create_task(
+            AsyncCombinator(slow_coro())
+            .or_else(never_called_coro, is_value_error)
+            .or_else(never_called_coro, error_guard(ValueError))()
+        )
+        await started.wait()
+        task.cancel()
 
-        def is_value_error(e: BaseException) -> TypeGuard[ValueError]:
-            return isinstance(e, ValueError)
+        with pytest.raises(asyncio.CancelledError):
+            await task
 
-        combinator = AsyncCombinator(err_coro())
-        result = await combinator.or_else(recover_coro, is_value_error)
+    @pytest.mark.asyncio
+    async def test_or_else_with_base_exception_guard(self):
+        """Test that or_else can still recover from a BaseException subclass."""
+
+        async def cancelled_coro() -> str:
+            raise asyncio.CancelledError()
+
+        async def recover_coro(error: asyncio.CancelledError) -> str:
+            return "recovered"
+
+        result = await AsyncCombinator(cancelled_coro()).or_else(
+            recover_coro, error_guard(asyncio.CancelledError)
+        )
 
-        assert result == "TEST ERROR"
+        assert result == "recovered"
@@ -1,77 +1,89 @@
+import functools
 import pytest
 import asyncio
 from async_combinator import AsyncCombinator
+from .conftest import ready
 
 
-class TestAsyncCombinatorThen:
-    """Test cases for AsyncCombinator.then method."""
+async def double_coro(n: int) -> int:
+    return n * 2
 
-    @pytest.mark.asyncio
-    async def test_then_basic_functionality(self):
-        """Test basic then method functionality."""
 
-        async def initial_coro():
-            return 5
+async def add_one_coro(n: int) -> int:
+    return n + 1
 
-        async def double_coro(value: int):
-            return value * 2
 
-        combinator = AsyncCombinator(initial_coro())
-        result = await combinator.then(double_coro)
+async def square_coro(n: int) -> int:
+    return n**2
 
-        assert result == 10
 
-    @pytest.mark.asyncio
-    async def test_then_with_different_types(self):
-        """Test then method with different input and output types."""
+async def length_coro(s: str) -> int:
+    return len(s)
 
-        async def string_coro():
-            return "hello"
 
-        async def length_coro(s: str):
-            return len(s)
+async def is_even_coro(n: int) -> bool:
+    return n % 2 == 0
 
-        async def is_even_coro(n: int):
-            return n % 2 == 0
 
-        combinator = AsyncCombinator(string_coro())
-        result = await combinator.then(length_coro).then(is_even_coro)
+async def is_prime_coro(n: int) -> bool:
+    if n < 2:
+        return False
+    for i in range(2, int(n**0.5) + 1):
+        if n % i == 0:
+            return False
+    return True
 
-        assert result is False  # len("hello") = 5, which is odd
 
-    @pytest.mark.asyncio
-    async def test_then_chaining(self):
-        """Test chaining multiple then calls."""
+async def negate_coro(b: bool) -> bool:
+    return not b
+
 
-        async def start_coro():
-            return 1
+async def str_coro(n: int) -> str:
+    return str(n)
 
-        async def add_one_coro(n: int):
-            return n + 1
 
-        async def multiply_by_two_coro(n: int):
-            return n * 2
+async def list_coro(s: str) -> list:
+    return list(s)
 
-        async def square_coro(n: int):
-            return n**2
 
-        result = await (
-            AsyncCombinator(start_coro())
-            .then(add_one_coro)
-            .then(multiply_by_two_coro)
-            .then(square_coro)
+class TestAsyncCombinatorThen:
+    """Test cases for AsyncCombinator.then method."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "initial, steps, expected",
+        [
+            pytest.param(5, [double_coro], 10, id="basic_functionality"),
+            pytest.param(
+                "hello", [length_coro, is_even_coro], False, id="different_types"
+            ),
+            pytest.param(
+                1,
+                [add_one_coro, double_coro, square_coro],
+                16,  # 1 -> 2 -> 4 -> 16
+                id="chaining",
+            ),
+            pytest.param(7, [is_prime_coro, negate_coro], False, id="boolean_logic"),
+            pytest.param(
+                42, [str_coro, list_coro], ["4", "2"], id="return_type_annotation"
+            ),
+        ],
+    )
+    async def test_then_basic_functionality(self, initial, steps, expected):
+        """Test then method applied once per step, in order."""
+
+        combinator = functools.reduce(
+            lambda acc, f: acc.then(f), steps, AsyncCombinator(ready(initial))
         )
+        result = await combinator
 
-        # 1 -> 2 -> 4 -> 16
-        assert result == 16
+        assert result == expected
+        assert type(result) is type(expected)
 
     @pytest.mark.asyncio
     async def test_then_with_complex_objects(self):
         """Test then method with complex objects."""
 
-        async def user_coro():
-            return {"id": 1, "name": "Alice", "age": 30}
-
         async def extract_name_coro(user: dict):
             return user["name"]
 
@@ -79,7 +91,9 @@ class TestAsyncCombinatorThen:
             return f"Hello, {name}!"
 
         result = (
-            await AsyncCombinator(user_coro()).then(extract_name_coro).then(greet_coro)
+            await AsyncCombinator(ready({"id": 1, "name": "Alice", "age": 30}))
+            .then(extract_name_coro)
+            .then(greet_coro)
         )
 
         assert result == "Hello, Alice!"
@@ -88,13 +102,10 @@ class TestAsyncCombinatorThen:
     async def test_then_exception_propagation(self):
         """Test that exceptions in then functions are properly propagated."""
 
-        async def initial_coro():
-            return 10
-
         async def failing_coro(value: int):
             raise ValueError(f"Failed with value {value}")
 
-        combinator = AsyncCombinator(initial_coro())
+        combinator = AsyncCombinator(ready(10))
 
         with pytest.raises(ValueError, match="Failed with value 10"):
             await combinator.then(failing_coro)
@@ -104,78 +115,28 @@ class TestAsyncCombinatorThen:
         """Test then method with async operations that include delays."""
 
         async def slow_coro():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)  # Yield to the event loop once
             return "slow_result"
 
         async def process_coro(s: str):
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
             return f"processed_{s}"
 
-        start_time = asyncio.get_event_loop().time()
         result = await AsyncCombinator(slow_coro()).then(process_coro)
-        end_time = asyncio.get_event_loop().time()
 
         assert result == "processed_slow_result"
-        assert end_time - start_time >= 0.02  # Should take at least 20ms
 
     @pytest.mark.asyncio
     async def test_then_with_none_values(self):
         """Test then method with None values."""
 
-        async def none_coro():
-            return None
-
         async def check_none_coro(value):
             return value is None
 
-        result = await AsyncCombinator(none_coro()).then(check_none_coro)
+        result = await AsyncCombinator(ready(None)).then(check_none_coro)
 
         assert result is True
 
-    @pytest.mark.asyncio
-    async def test_then_with_boolean_logic(self):
-        """Test then method with boolean operations."""
-
-        async def number_coro():
-            return 7
-
-        async def is_prime_coro(n: int):
-            if n < 2:
-                return False
-            for i in range(2, int(n**0.5) + 1):
-                if n % i == 0:
-                    return False
-            return True
-
-        async def is_odd_coro(n: int):
-            return n % 2 == 1
-
-        async def negate_coro(is_prime: bool):
-            return not is_prime
-
-        result = await (
-            AsyncCombinator(number_coro()).then(is_prime_coro).then(negate_coro)
-        )
-
-        assert result is False  # 7 is prime, so not prime = False
-
-    @pytest.mark.asyncio
-    async def test_then_return_type_annotation(self):
-        """Test that then method properly handles type annotations."""
-
-        async def int_coro() -> int:
-            return 42
-
-        async def str_coro(n: int) -> str:
-            return str(n)
-
-        async def list_coro(s: str) -> list:
-            return list(s)
-
-        result = await AsyncCombinator(int_coro()).then(str_coro).then(list_coro)
-
-        assert result == ["4", "2"]
-
     @pytest.mark.asyncio
     async def test_then_with_error_in_initial_coro(self):
         """Test that errors in the initial coroutine are propagated through then."""
@@ -196,15 +157,13 @@ class TestAsyncCombinatorThen:
         """Test then method with asyncio Task and Future objects."""
 
         async def task_coro():
-            await asyncio.sleep(0.01)
+            await asyncio.sleep(0)
             return "task_result"
 
-        async def future_coro(s: str):
-            future = asyncio.Future()
-            future.set_result(f"future_{s}")
-            return await future
+        def future_func(s: str) -> asyncio.Future[str]:
+            return ready(f"future_{s}")
 
         task = asyncio.create_task(task_coro())
-        result = await AsyncCombinator(task).then(future_coro)
+        result = await AsyncCombinator(task).then(future_func)
 
         assert result == "future_task_result"